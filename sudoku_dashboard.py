@@ -1,6 +1,17 @@
 import streamlit as st
-from sudoku_mip_solver import SudokuMIPSolver
+import numpy as np
+import pandas as pd
+import sudoku_fast
+import sudoku_parallel
 import time
+import hashlib
+import os
+import multiprocessing
+import shelve
+import dbm
+import threading
+import queue
+from contextlib import closing
 
 def main():
     st.set_page_config(
@@ -9,6 +20,9 @@ def main():
         layout="wide",
         initial_sidebar_state="expanded"
     )
+    
+    # Board styles are emitted once per run here, so each rendered board only carries its markup
+    st.html(SUDOKU_CSS)
 
     st.title("🧩 Sudoku Dashboard")
     st.markdown("Generate, manipulate, and solve Sudoku puzzles with customizable parameters")
@@ -85,7 +99,7 @@ def get_grid_dimensions():
 
 def solve_options_section():
     """Display solving options section"""
-    if 'current_solver' not in st.session_state:
+    if get_current_solver() is None:
         return
     
     st.subheader("Solving Options")
@@ -131,55 +145,211 @@ def solve_options_section():
                 solve_puzzle_with_options(1, status_placeholder, False)
 
 
+@st.cache_resource(show_spinner=False)
+def get_solver_class():
+    """Import the MIP solver on first use, so loading it does not hold up the first page render"""
+    from sudoku_mip_solver import SudokuMIPSolver
+    return SudokuMIPSolver
+
+
+# Shared across reruns and sessions, so the active solver is only read, never solved in place
+@st.cache_resource(show_spinner=False, max_entries=64)
+def build_solver_from_string(puzzle_string, sub_grid_width, sub_grid_height):
+    """Parse a puzzle string into a solver, reusing the solver for strings seen before"""
+    SudokuMIPSolver = get_solver_class()
+    return SudokuMIPSolver.from_string(
+        puzzle_string,
+        sub_grid_width=sub_grid_width,
+        sub_grid_height=sub_grid_height
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def build_solver_from_board(board_key, _board, sub_grid_width, sub_grid_height):
+    """Build a solver for a board, reusing the solver for boards seen before"""
+    SudokuMIPSolver = get_solver_class()
+    return SudokuMIPSolver(_board, sub_grid_width, sub_grid_height)
+
+
+def queue_status_messages(key, *messages):
+    """Keep (kind, text) status messages to show after the app reruns"""
+    st.session_state[key] = messages
+
+
+def show_status_messages(key, container=st):
+    """Show and forget the status messages queued under key"""
+    for kind, text in st.session_state.pop(key, ()):
+        getattr(container, kind)(text)
+
+
+# Session state that belongs to the solution of the active puzzle
+SOLUTION_STATE_KEYS = (
+    'current_solution',
+    'current_solution_string',
+    'current_solution_pretty',
+    'multiple_solutions',
+    'multiple_solutions_html',
+    'solve_time',
+    'multi_solve_time',
+    'multi_search_stopped'
+)
+
+
 def clear_solution_state():
     """Clear solution-related state when loading a new puzzle"""
-    keys_to_clear = [
-        'current_solution',
-        'multiple_solutions',
-        'solve_time',
-        'multi_solve_time'
-    ]
+    for key in SOLUTION_STATE_KEYS:
+        st.session_state.pop(key, None)
+
+
+def get_current_solver():
+    """Return the active puzzle's solver, or None before a puzzle is loaded"""
+    return st.session_state.get('current_solver')
+
+
+def set_current_solver(solver):
+    """Store the active puzzle along with statistics that only change with the puzzle"""
+    st.session_state.current_solver = solver
+    # SudokuMIPSolver needs Python ints in its board, so keep a contiguous int8 copy alongside it
+    st.session_state.current_board_array = board_to_array(solver.board)
+    # Computed once here, so caches keyed on the puzzle never hash the board again
+    st.session_state.current_board_digest = board_digest(st.session_state.current_board_array)
+    st.session_state.current_clues = count_clues(st.session_state.current_board_array)
+    st.session_state.current_total_cells = len(solver.board) ** 2
+    st.session_state.current_puzzle_string = board_to_string(st.session_state.current_board_array)
+    st.session_state.current_puzzle_pretty = solver.get_pretty_string(solver.board)
+
+
+# Worker processes are spawned rather than forked, as the Streamlit server process is multi-threaded
+WORKER_CONTEXT = multiprocessing.get_context("spawn")
+
+# Unseeded generation with at least this many attempts is raced across processes
+PARALLEL_GENERATION_MIN_ATTEMPTS = 50
+
+# Smaller grids generate quicker than worker processes start, so they are never raced
+PARALLEL_GENERATION_MIN_GRID_SIZE = 12
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def generate_seeded_puzzle(sub_grid_width, sub_grid_height, target_difficulty, unique_solution, max_attempts, random_seed):
+    """Generate the puzzle for a fixed seed, reusing it when the same parameters come up again"""
+    SudokuMIPSolver = get_solver_class()
+    return SudokuMIPSolver.generate_random_puzzle(
+        sub_grid_width=sub_grid_width,
+        sub_grid_height=sub_grid_height,
+        target_difficulty=target_difficulty,
+        unique_solution=unique_solution,
+        max_attempts=max_attempts,
+        random_seed=random_seed
+    )
+
+
+def generate_puzzle(sub_grid_width, sub_grid_height, difficulty, unique_solution, max_attempts, random_seed):
+    """Generate a puzzle, racing independent generators in parallel when that can pay off"""
+    generation_args = dict(
+        sub_grid_width=sub_grid_width,
+        sub_grid_height=sub_grid_height,
+        target_difficulty=difficulty,
+        unique_solution=unique_solution,
+        max_attempts=max_attempts
+    )
+    
+    # Seeded generation has to stay serial to be reproducible, so it is cached instead
+    if random_seed is not None:
+        return generate_seeded_puzzle(random_seed=random_seed, **generation_args)
+    
+    SudokuMIPSolver = get_solver_class()
     
-    for key in keys_to_clear:
-        if key in st.session_state:
-            del st.session_state[key]
+    # Without the uniqueness requirement generation is a single solve
+    workers = os.cpu_count() or 1
+    if (
+        not unique_solution
+        or max_attempts < PARALLEL_GENERATION_MIN_ATTEMPTS
+        or sub_grid_width * sub_grid_height < PARALLEL_GENERATION_MIN_GRID_SIZE
+        or workers < 2
+    ):
+        return SudokuMIPSolver.generate_random_puzzle(**generation_args)
+    
+    result_queue = WORKER_CONTEXT.Queue()
+    processes = []
+    
+    try:
+        for _ in range(workers):
+            process = WORKER_CONTEXT.Process(
+                target=sudoku_parallel.generate_puzzle_to_queue,
+                args=(SudokuMIPSolver, generation_args, result_queue),
+                daemon=True
+            )
+            process.start()
+            processes.append(process)
+        
+        # Take the first puzzle that reaches the target difficulty, otherwise the hardest one
+        best = None
+        error = None
+        for _ in range(workers):
+            result = get_worker_item(result_queue, processes, "generator worker")
+            if isinstance(result, Exception):
+                error = result
+                continue
+            
+            solver, actual_difficulty = result
+            if actual_difficulty >= difficulty - 1e-9:
+                return solver, actual_difficulty
+            if best is None or actual_difficulty > best[1]:
+                best = result
+        
+        if best is None:
+            raise error
+        return best
+    finally:
+        # Every generator starts straight away, so the ones still running are stopped rather than left to finish
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
 
 
+# Fragment, so generating a puzzle only reruns this tab until the new puzzle is ready
+@st.fragment
 def generate_puzzle_tab(sub_grid_width, sub_grid_height):
     """Generate puzzle tab content"""
     st.subheader("Puzzle Parameters")
-    difficulty = st.slider(
-        "Difficulty Level",
-        min_value=0.0,
-        max_value=1.0,
-        value=0.75,
-        step=0.05,
-        help="0.0 = easiest (more clues), 1.0 = hardest (fewer clues)"
-    )
     
-    unique_solution = st.checkbox(
-        "Ensure Unique Solution",
-        value=True,
-        help="If checked, ensures the puzzle has exactly one solution"
-    )
-    
-    max_attempts = st.number_input(
-        "Max Generation Attempts",
-        min_value=10,
-        max_value=500,
-        value=100,
-        help="Maximum attempts to generate a puzzle with the specified difficulty"
-    )
-    
-    random_seed = st.number_input(
-        "Random Seed (optional)",
-        min_value=0,
-        max_value=999999,
-        value=None,
-        help="Set a seed for reproducible puzzle generation"
-    )
+    # Parameter changes are only sent when the form is submitted, not one rerun per widget
+    with st.form("generate_form", border=False):
+        difficulty = st.slider(
+            "Difficulty Level",
+            min_value=0.0,
+            max_value=1.0,
+            value=0.75,
+            step=0.05,
+            help="0.0 = easiest (more clues), 1.0 = hardest (fewer clues)"
+        )
+        
+        unique_solution = st.checkbox(
+            "Ensure Unique Solution",
+            value=True,
+            help="If checked, ensures the puzzle has exactly one solution"
+        )
+        
+        max_attempts = st.number_input(
+            "Max Generation Attempts",
+            min_value=10,
+            max_value=500,
+            value=100,
+            help="Maximum attempts to generate a puzzle with the specified difficulty"
+        )
+        
+        random_seed = st.number_input(
+            "Random Seed (optional)",
+            min_value=0,
+            max_value=999999,
+            value=None,
+            help="Set a seed for reproducible puzzle generation"
+        )
+        
+        submitted = st.form_submit_button("🎲 Generate Puzzle", type="primary")
     
-    if st.button("🎲 Generate Puzzle", type="primary"):
+    if submitted:
         with st.spinner("Generating puzzle..."):
             try:
                 start_time = time.time()
@@ -189,45 +359,54 @@ def generate_puzzle_tab(sub_grid_width, sub_grid_height):
                 
                 seed_val = random_seed if random_seed is not None else None
                 
-                solver, actual_difficulty = SudokuMIPSolver.generate_random_puzzle(
-                    sub_grid_width=sub_grid_width,
-                    sub_grid_height=sub_grid_height,
-                    target_difficulty=difficulty,
-                    unique_solution=unique_solution,
-                    max_attempts=max_attempts,
-                    random_seed=seed_val
+                solver, actual_difficulty = generate_puzzle(
+                    sub_grid_width,
+                    sub_grid_height,
+                    difficulty,
+                    unique_solution,
+                    max_attempts,
+                    seed_val
                 )
                 
                 generation_time = time.time() - start_time
                 
                 # Store in session state
-                st.session_state.current_solver = solver
+                set_current_solver(solver)
                 st.session_state.generated_difficulty = actual_difficulty
                 st.session_state.generation_time = generation_time
-                st.session_state.string_puzzle_input = solver.to_string()
+                st.session_state.string_puzzle_input = st.session_state.current_puzzle_string
 
-                st.success(f"Puzzle generated successfully in {generation_time:.2f} seconds!")
-                st.info(f"Actual difficulty: {actual_difficulty:.3f}")
+                queue_status_messages(
+                    "generate_status",
+                    ("success", f"Puzzle generated successfully in {generation_time:.2f} seconds!"),
+                    ("info", f"Actual difficulty: {actual_difficulty:.3f}")
+                )
+                # The new puzzle is shown outside this fragment, so rerun the whole app
+                st.rerun()
                 
             except Exception as e:
                 st.error(f"Error generating puzzle: {str(e)}")
     
+    show_status_messages("generate_status")
+    
 
+# Fragment, so loading or clearing the string field does not rerun the rest of the app
+@st.fragment
 def string_input_tab(sub_grid_width, sub_grid_height):
     """String input tab content"""
     grid_size = sub_grid_width * sub_grid_height
 
     st.subheader("String Input")
     
-    # Button row - matching the manual input tab layout
-    col_load, col_update, col_clear = st.columns(3)
+    # Button row - the update button is the form's submit button below
+    col_load, col_clear = st.columns(2)
     status_container = st.empty()
+    show_status_messages("string_input_status", status_container)
     
     with col_load:
         if st.button("📥 Load Current Puzzle", help="Load the active puzzle into the string input field"):
-            if 'current_solver' in st.session_state:
-                solver = st.session_state.current_solver
-                st.session_state.string_puzzle_input = solver.to_string()
+            if get_current_solver() is not None:
+                st.session_state.string_puzzle_input = st.session_state.current_puzzle_string
                 status_container.success("Puzzle loaded into string input!")
             else:
                 status_container.warning("No active puzzle to load!")
@@ -240,32 +419,33 @@ def string_input_tab(sub_grid_width, sub_grid_height):
     # Get current value from session state or use empty string
     current_value = st.session_state.get('string_puzzle_input', '')
     
-    puzzle_string = st.text_area(
-        "Enter puzzle string:",
-        value=current_value,
-        placeholder=f"Enter {grid_size}x{grid_size} puzzle as a string with 0 for empty cells",
-        help=f"Enter puzzle as a string of {grid_size**2} characters with 0 or . for empty cells",
-        height=100
-    )
+    # A form only sends the string on submit, rather than rerunning after every edit
+    with st.form("string_input_form", border=False):
+        puzzle_string = st.text_area(
+            "Enter puzzle string:",
+            value=current_value,
+            placeholder=f"Enter {grid_size}x{grid_size} puzzle as a string with 0 for empty cells",
+            help=f"Enter puzzle as a string of {grid_size**2} characters with 0 or . for empty cells",
+            height=100
+        )
+        submitted = st.form_submit_button("🚀 Update Puzzle", help="Update the active puzzle with the string input")
     
     # Update session state when text changes
     if puzzle_string != current_value:
         st.session_state.string_puzzle_input = puzzle_string
     
-    # Update puzzle button (after text area creation)
-    with col_update:
-        if st.button("🚀 Update Puzzle", help="Update the active puzzle with the string input", disabled=not puzzle_string.strip()):
+    if submitted:
+        if not puzzle_string.strip():
+            status_container.warning("Enter a puzzle string first!")
+        else:
             try:
                 # Clear previous solutions
                 clear_solution_state()
                 
-                solver = SudokuMIPSolver.from_string(
-                    puzzle_string.strip(),
-                    sub_grid_width=sub_grid_width,
-                    sub_grid_height=sub_grid_height
-                )
-                st.session_state.current_solver = solver
-                status_container.success("Puzzle updated successfully!")
+                solver = build_solver_from_string(puzzle_string.strip(), sub_grid_width, sub_grid_height)
+                set_current_solver(solver)
+                queue_status_messages("string_input_status", ("success", "Puzzle updated successfully!"))
+                st.rerun()
             except Exception as e:
                 status_container.error(f"Error parsing puzzle string: {str(e)}")
     
@@ -276,33 +456,38 @@ def file_input_tab(sub_grid_width, sub_grid_height):
     
     # Only process if we have a file and haven't processed this exact file yet
     if uploaded_file is not None:
-        # Use file content hash to detect if this is a new file
-        content = uploaded_file.read().decode('utf-8')
-        content_hash = hash(content)
-        
-        # Only process if this is a new file upload
-        if st.session_state.get('last_uploaded_hash') != content_hash:
-            try:
-                # Clear previous solutions
-                clear_solution_state()
-                
-                solver = SudokuMIPSolver.from_string(
-                    content.strip(),
-                    sub_grid_width=sub_grid_width,
-                    sub_grid_height=sub_grid_height
-                )
-                st.session_state.current_solver = solver
-                st.session_state.last_uploaded_hash = content_hash
-                st.success("Puzzle loaded from file successfully!")
-            except Exception as e:
-                st.error(f"Error parsing file: {str(e)}")
+        # Room for every cell as a multi-digit value plus a delimiter, and some surrounding whitespace
+        grid_size = sub_grid_width * sub_grid_height
+        max_file_size = grid_size * grid_size * (len(str(grid_size)) + 2) + 1024
+        if uploaded_file.size > max_file_size:
+            st.error(f"File is too large for a {grid_size}x{grid_size} puzzle ({uploaded_file.size} bytes)")
+        else:
+            # Streamlit gives every upload its own id, so a file is only read once it is new
+            file_id = uploaded_file.file_id
+            
+            # Only process if this is a new file upload
+            if st.session_state.get('last_uploaded_file_id') != file_id:
+                try:
+                    # Clear previous solutions
+                    clear_solution_state()
+                    
+                    # Puzzle strings only hold digits, dots and delimiters
+                    content = uploaded_file.read().decode('ascii')
+                    solver = build_solver_from_string(content.strip(), sub_grid_width, sub_grid_height)
+                    set_current_solver(solver)
+                    st.session_state.last_uploaded_file_id = file_id
+                    st.success("Puzzle loaded from file successfully!")
+                except Exception as e:
+                    st.error(f"Error parsing file: {str(e)}")
     
     # Clear upload cache button - only show if there's cache to clear
-    if 'last_uploaded_hash' in st.session_state:
+    if 'last_uploaded_file_id' in st.session_state:
         if st.button("🗑️ Clear Upload Cache", help="Clear the upload cache to allow re-uploading the same file"):
-            del st.session_state.last_uploaded_hash
+            del st.session_state.last_uploaded_file_id
             st.success("Upload cache cleared! You can now re-upload the same file.")
 
+# Fragment, so editing the grid does not rerun the rest of the app
+@st.fragment
 def manual_input_tab(sub_grid_width, sub_grid_height):
     """Manual input tab content"""
     grid_size = sub_grid_width * sub_grid_height
@@ -312,10 +497,11 @@ def manual_input_tab(sub_grid_width, sub_grid_height):
     # Load current puzzle button
     col_load, col_update, col_clear = st.columns(3)
     status_container = st.empty()
+    show_status_messages("manual_input_status", status_container)
     with col_load:
         if st.button("📥 Load Current Puzzle", help="Load the active puzzle into the manual input grid"):
-            if 'current_solver' in st.session_state:
-                solver = st.session_state.current_solver
+            solver = get_current_solver()
+            if solver is not None:
                 solver_grid_size = len(solver.board)
                 
                 # Check if the current puzzle matches the manual input grid size
@@ -343,96 +529,99 @@ def manual_input_tab(sub_grid_width, sub_grid_height):
                 clear_solution_state()
                 
                 # The board already contains None for empty cells and integers for filled cells
-                solver = SudokuMIPSolver(board, sub_grid_width, sub_grid_height)
-                st.session_state.current_solver = solver
-                status_container.success("Puzzle created successfully!")
+                solver = build_solver_from_board(board_digest(board), board, sub_grid_width, sub_grid_height)
+                set_current_solver(solver)
+                queue_status_messages("manual_input_status", ("success", "Puzzle created successfully!"))
+                st.rerun()
             except Exception as e:
                 status_container.error(f"Error creating puzzle: {str(e)}")
         
 
+def manual_grid_frame(board):
+    """Build the data frame behind the manual input editor, with <NA> for empty cells"""
+    grid_size = len(board)
+    return pd.DataFrame(
+        [[cell or None for cell in row] for row in board],
+        index=range(1, grid_size + 1),
+        columns=[str(j) for j in range(1, grid_size + 1)],
+        dtype="Int64"
+    )
+
+
 def create_manual_input_grid(grid_size):
     """Create a manual input grid for entering puzzle values"""
     
-    # Initialize session state keys to None if they don't exist (ensures empty widgets on first load)
-    for i in range(grid_size):
-        for j in range(grid_size):
-            key = f"manual_cell_{grid_size}_{i}_{j}"
-            if key not in st.session_state:
-                st.session_state[key] = None
+    # The editor starts from this frame and keeps its own edits under the editor key
+    # Include grid_size in keys to avoid conflicts when grid size changes
+    grid_key = f"manual_grid_{grid_size}"
+    if grid_key not in st.session_state:
+        st.session_state[grid_key] = manual_grid_frame([[None] * grid_size for _ in range(grid_size)])
     
     st.write(f"Enter values for {grid_size}×{grid_size} grid (leave empty or enter 0 for blank cells):")
     
-    board = []
+    # One editor for the whole grid, instead of a number input per cell
+    edited = st.data_editor(
+        st.session_state[grid_key],
+        num_rows="fixed",
+        column_config={
+            column: st.column_config.NumberColumn(
+                column,
+                min_value=0,
+                max_value=grid_size,
+                step=1,
+                format="%d",
+                width="small"
+            )
+            for column in st.session_state[grid_key].columns
+        },
+        key=f"manual_editor_{grid_size}_{st.session_state.get('manual_editor_version', 0)}"
+    )
     
-    for i in range(grid_size):
-        row = []
-        st.write(f"**Row {i+1}:**")
-        row_cols = st.columns(grid_size)
-        
-        for j in range(grid_size):
-            with row_cols[j]:
-                # Get existing value from session state if available
-                # Include grid_size in key to avoid conflicts when grid size changes
-                key = f"manual_cell_{grid_size}_{i}_{j}"
-                
-                value = st.number_input(
-                    f"({i+1},{j+1})",
-                    min_value=0,
-                    max_value=grid_size,
-                    key=key,
-                    label_visibility="collapsed",
-                    help=f"Cell ({i+1},{j+1}) - Enter number 1-{grid_size} or 0 to leave empty",
-                    placeholder="·",
-                    width=120 # Hides the +/- buttons
-                )
-                # Convert 0 values to None for SudokuMIPSolver compatibility
-                row.append(None if value == 0 else value)
-        board.append(row)
-
-    return board
+    # Convert 0 values to None for SudokuMIPSolver compatibility
+    return [[value or None for value in row] for row in edited.fillna(0).to_numpy(dtype=int).tolist()]
 
 
 def load_puzzle_into_manual_input(puzzle_board, grid_size):
     """Load an existing puzzle into the manual input grid"""
-    for i in range(min(len(puzzle_board), grid_size)):
-        for j in range(min(len(puzzle_board[i]), grid_size)):
-            # Include grid_size in key to match the key format used in create_manual_input_grid
-            key = f"manual_cell_{grid_size}_{i}_{j}"
-            value = puzzle_board[i][j]
-            # Store the actual value (None for empty, integer for filled)
-            st.session_state[key] = value if value is not None and value != 0 else None
+    st.session_state[f"manual_grid_{grid_size}"] = manual_grid_frame(puzzle_board)
+    # A new editor key drops earlier edits on both server and browser, so the editor shows the loaded puzzle as is
+    st.session_state.manual_editor_version = st.session_state.get('manual_editor_version', 0) + 1
 
 
 def clear_manual_input_grid(grid_size):
     """Clear all values in the manual input grid"""
-    for i in range(grid_size):
-        for j in range(grid_size):
-            # Include grid_size in key to match the key format used in create_manual_input_grid
-            key = f"manual_cell_{grid_size}_{i}_{j}"
-            if key in st.session_state:
-                st.session_state[key] = None
+    st.session_state[f"manual_grid_{grid_size}"] = manual_grid_frame([[None] * grid_size for _ in range(grid_size)])
+    st.session_state.manual_editor_version = st.session_state.get('manual_editor_version', 0) + 1
 
 
+# As a fragment, the solution selector and export options only rerun this panel, not the input column
+@st.fragment
 def display_puzzle_and_results():
     """Display puzzle and solution in the right column"""
 
     st.subheader("Current Puzzle and Solution")
-    if 'current_solver' in st.session_state:
+    # Read once and passed down, so the rendering helpers do not go back to session state
+    solver = get_current_solver()
+    if solver is not None:
 
         original_col, solved_col = st.columns(2)
         original_export_col, solved_export_col = st.columns(2)
         with original_col:
-
-            solver = st.session_state.current_solver
             
             # Display original puzzle
-            display_sudoku_board(solver.board, "Puzzle")
+            display_sudoku_board(
+                st.session_state.current_board_array,
+                solver,
+                "Puzzle",
+                "puzzle_board_html",
+                board_key=st.session_state.current_board_digest
+            )
             
             col1, col2 = st.columns(2)
             with col1:
                 # Display puzzle statistics
-                clues = count_clues(solver.board)
-                total_cells = len(solver.board) ** 2
+                clues = st.session_state.current_clues
+                total_cells = st.session_state.current_total_cells
                 st.metric("Clues", f"{clues}/{total_cells}")
             with col2:    
                 if 'generated_difficulty' in st.session_state:
@@ -442,15 +631,20 @@ def display_puzzle_and_results():
             
         with original_export_col:
             # Export options
-            create_export_interface("Puzzle", solver.board, "puzzle_format_radio")
+            create_export_interface(
+                "Puzzle",
+                st.session_state.current_puzzle_string,
+                st.session_state.current_puzzle_pretty,
+                "puzzle_format_radio"
+            )
         
-        # Determine which solution board to use for export
-        selected_solution_board = None
+        # Determine which solution strings to use for export
+        solution_strings = None
         
         with solved_col:
             # Display solution if available
             if 'current_solution' in st.session_state:
-                display_sudoku_board(st.session_state.current_solution, "Solution")
+                display_sudoku_board(st.session_state.current_solution, solver, "Solution", "solution_board_html")
                 
                 # Solution statistics
                 st.subheader("Solution Statistics")
@@ -460,16 +654,28 @@ def display_puzzle_and_results():
                 with col_sol2:
                     st.metric("Status", "Solved ✓")
                 
-                selected_solution_board = st.session_state.current_solution
+                solution_strings = (
+                    st.session_state.current_solution_string,
+                    st.session_state.current_solution_pretty
+                )
 
             # Display multiple solutions if available
             elif 'multiple_solutions' in st.session_state:
-                selected_solution_board = display_multiple_solutions()
+                selected_solution = display_multiple_solutions(solver)
+                if selected_solution is not None:
+                    selected_solution_board, selected_solution_digest = selected_solution
+                    solution_strings = board_export_strings(
+                        selected_solution_digest,
+                        selected_solution_board,
+                        solver,
+                        solver.sub_grid_width,
+                        solver.sub_grid_height
+                    )
 
         with solved_export_col:
-            if selected_solution_board is not None:
+            if solution_strings is not None:
                 # Export solution (works for both single and multiple solutions)
-                create_export_interface("Solution", selected_solution_board, "solution_format_radio")
+                create_export_interface("Solution", *solution_strings, "solution_format_radio")
         
     else:
         st.info("Please generate or input a puzzle using the options on the left")
@@ -512,6 +718,12 @@ def display_sidebar():
         - Use the string format to input puzzles from other sources
         """)
 
+        st.header("🗄️ Solution Cache")
+        st.write("Solved puzzles are cached on disk, so solving them again is instant.")
+        if st.button("🗑️ Clear Solution Cache", help="Forget all cached solutions"):
+            clear_solution_cache()
+            st.success("Solution cache cleared!")
+
         st.header("🔗 Links")
         st.write("""
         - [sudoku-mip-solver GitHub](https://github.com/DenHvideDvaerg/sudoku-mip-solver)
@@ -520,19 +732,13 @@ def display_sidebar():
 
 
 # Helper functions
-def create_export_interface(content_type, board_data, radio_key):
+def create_export_interface(content_type, content_string, pretty_string, radio_key):
     """Create complete export interface with expander, text area, and download options"""
     
-    if "current_solver" not in st.session_state:
-        return
-    
-    solver = st.session_state.current_solver
-
     with st.expander("Export Options"):
         col_exp1, col_exp2 = st.columns(2)
         
         with col_exp1:
-            content_string = solver.to_string(board_data)
             st.text_area(f"{content_type} as String", content_string, height=68)
         
         with col_exp2:
@@ -552,47 +758,74 @@ def create_export_interface(content_type, board_data, radio_key):
                 file_suffix = "string"
                 format_help = f"{content_type} in string format (compatible with re-import)"
             else:
-                download_content = solver.get_pretty_string(board_data)
+                download_content = pretty_string
                 file_suffix = "pretty"
                 format_help = f"{content_type} in pretty format (human-readable)"
             
+            # Passed as a callable, so the file is only handed over when the button is clicked
             st.download_button(
                 f"📥 Download {content_type}",
-                download_content,
+                lambda: download_content,
                 file_name=f"sudoku_{content_type.lower()}_{file_suffix}_{int(time.time())}.txt",
                 mime="text/plain",
                 help=format_help
             )
 
 
+# Bounded, since every solution browsed in the multiple-solutions view adds an entry
+@st.cache_data(max_entries=32, show_spinner=False)
+def board_export_strings(board_key, _board, _solver, sub_grid_width, sub_grid_height):
+    """Return the plain and pretty export strings for a board, cached by its digest"""
+    return board_to_string(_board), _solver.get_pretty_string(_board)
+
+
+def board_to_array(board):
+    """Convert a board to a contiguous int8 array with 0 for empty cells"""
+    if isinstance(board, np.ndarray):
+        return board
+    
+    # None becomes NaN in a float array, which nan_to_num maps back to 0
+    return np.nan_to_num(np.array(board, dtype=float)).astype(np.int8)
+
+
+def board_to_string(board):
+    """Convert a board to the same string as SudokuMIPSolver.to_string, without formatting every cell in Python"""
+    values = board_to_array(board).ravel()
+    if values.size <= 81:
+        # Grids up to 9x9 only hold single digits, which map straight onto their ASCII codes
+        return (values + ord("0")).astype(np.uint8).tobytes().decode("ascii")
+    
+    return " ".join(map(str, values.tolist()))
+
+
+def board_digest(board):
+    """Hash a board's cells into a short key, so caches need not hash the board cell by cell"""
+    return hashlib.sha1(board_to_array(board).tobytes()).hexdigest()
+
+
 def count_clues(board):
-    return sum(sum(1 for cell in row if cell != 0 and cell is not None) for row in board)
+    return int(np.count_nonzero(board_to_array(board)))
 
 
-def display_sudoku_board(board, title="Sudoku Board"):
+def display_sudoku_board(board, solver, title="Sudoku Board", html_key=None, board_html=None, board_key=None):
     st.subheader(title)
     
-    # Create a styled display of the Sudoku board
-    board_html = create_sudoku_html(board)
     if board_html is None:
-        st.warning("Unable to display the Sudoku board. No solver is available.")
-        return
+        # Reuse the HTML stored under html_key as long as it was rendered from this very board
+        cached_board, board_html = st.session_state.get(html_key, (None, None)) if html_key else (None, None)
+        
+        if cached_board is not board:
+            # Create a styled display of the Sudoku board
+            board_html = create_sudoku_html(board, solver, board_key)
+            if html_key:
+                st.session_state[html_key] = (board, board_html)
     
-    st.markdown(board_html, unsafe_allow_html=True)
-
+    # The board is already final HTML, so it skips the Markdown parser
+    st.html(board_html)
 
-def create_sudoku_html(board):
-    if "current_solver" not in st.session_state:
-        return
-    
-    solver = st.session_state.current_solver
 
-    grid_size = len(board)
-    sub_grid_width = solver.sub_grid_width
-    sub_grid_height = solver.sub_grid_height
-    
-    # Simple CSS that adapts to Streamlit's theme
-    html = """
+# Simple CSS that adapts to Streamlit's theme
+SUDOKU_CSS = """
     <style>
     .sudoku-grid {
         display: inline-block;
@@ -616,42 +849,385 @@ def create_sudoku_html(board):
         opacity: 1;
     }
     .sudoku-grid .empty { opacity: 0.4; }
+    .sudoku-svg {
+        display: inline-block;
+        font-family: monospace;
+        font-size: 16px;
+        margin: 10px auto;
+    }
+    .sudoku-svg .grid-thin { fill: none; stroke: currentColor; stroke-width: 1; opacity: 0.6; }
+    .sudoku-svg .grid-thick { fill: none; stroke: currentColor; stroke-width: 2; }
+    .sudoku-svg .clue-cells { fill: rgba(var(--primary-color-rgb, 255, 75, 75), 0.1); }
+    .sudoku-svg text {
+        fill: currentColor;
+        font-weight: bold;
+        text-anchor: middle;
+        dominant-baseline: central;
+    }
     </style>
-    <table class="sudoku-grid">
     """
+
+# Boards larger than this are drawn as a single SVG, as a table would need one DOM node per cell
+TABLE_MAX_GRID_SIZE = 16
+
+# Width and height of a cell in the SVG board, matching the table cells
+SVG_CELL_SIZE = 35
+
+# Cell class attribute for every 3-bit cell index: is clue << 2 | thick bottom border << 1 | thick right border
+SUDOKU_CELL_CLASSES = np.array([
+    " ".join(
+        (["thick-right"] if index & 1 else [])
+        + (["thick-bottom"] if index & 2 else [])
+        + ["clue" if index & 4 else "empty"]
+    )
+    for index in range(8)
+])
+
+
+def build_sudoku_template(sub_grid_width, sub_grid_height):
+    """Build a str.format template of the board rows with the sub-grid borders baked in"""
+    grid_size = sub_grid_width * sub_grid_height
+    thick_right_cols = set(range(sub_grid_width - 1, grid_size - 1, sub_grid_width))
+    thick_bottom_rows = set(range(sub_grid_height - 1, grid_size - 1, sub_grid_height))
+    
+    rows = []
+    for i in range(grid_size):
+        cells = []
+        for j in range(grid_size):
+            borders = (["thick-right"] if j in thick_right_cols else []) + (["thick-bottom"] if i in thick_bottom_rows else [])
+            # Each cell leaves two holes: its clue/empty class and its displayed value
+            cells.append('<td class="' + " ".join(borders + ["{}"]) + '">{}</td>')
+        rows.append("<tr>" + "".join(cells) + "</tr>")
+    
+    return "".join(rows)
+
+
+# The standard 9x9 board is by far the most common, so its table layout is prepared up front
+SUDOKU_TEMPLATE_9X9 = build_sudoku_template(3, 3)
+
+
+def create_sudoku_html(board, solver, board_key=None):
+    # The board itself is left out of the cache key, which is its digest instead
+    if board_key is None:
+        board_key = board_digest(board)
+    return build_sudoku_html(board_key, board, solver.sub_grid_width, solver.sub_grid_height)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_sudoku_html(board_key, _board, sub_grid_width, sub_grid_height):
+    return render_sudoku_html(_board, sub_grid_width, sub_grid_height)
+
+
+def render_sudoku_html(board, sub_grid_width, sub_grid_height):
+    """Render a board as HTML without going through the shared cache"""
+    if sub_grid_width == sub_grid_height == 3:
+        cell_args = [arg for row in board for cell in row for arg in (("clue", cell) if cell else ("empty", "·"))]
+        return '<table class="sudoku-grid">' + SUDOKU_TEMPLATE_9X9.format(*cell_args) + "</table>"
     
+    grid_size = len(board)
+    if grid_size > TABLE_MAX_GRID_SIZE:
+        return build_sudoku_svg(board, sub_grid_width, sub_grid_height)
+    
+    values = board_to_array(board)
+    is_clue = values != 0
+    
+    # Sub-grid boundaries are identical for every row/column, so work them out once per axis
+    index = np.arange(grid_size)
+    thick_right = ((index + 1) % sub_grid_width == 0) & (index < grid_size - 1)
+    thick_bottom = ((index + 1) % sub_grid_height == 0) & (index < grid_size - 1)
+    
+    # Broadcast the column and row borders against the clue mask to pick every cell's class at once
+    class_index = is_clue * 4 + thick_bottom[:, None] * 2 + thick_right[None, :]
+    cell_classes = SUDOKU_CELL_CLASSES[class_index].tolist()
+    cell_values = np.where(is_clue, values.astype(str), "·").tolist()
+    
+    rows = [
+        "<tr>" + "".join(f'<td class="{cls}">{value}</td>' for cls, value in zip(class_row, value_row)) + "</tr>"
+        for class_row, value_row in zip(cell_classes, cell_values)
+    ]
+    
+    return '<table class="sudoku-grid">' + "".join(rows) + "</table>"
+
+
+def build_sudoku_svg(board, sub_grid_width, sub_grid_height):
+    """Draw a board as one SVG with path data for the grid lines and text only for filled cells"""
+    grid_size = len(board)
+    size = grid_size * SVG_CELL_SIZE
+    
+    # Sub-grid boundaries get thick lines, every other cell boundary a thin one
+    thin_lines = []
+    thick_lines = [f"M0,0H{size}V{size}H0Z"]
+    for k in range(1, grid_size):
+        offset = k * SVG_CELL_SIZE
+        (thick_lines if k % sub_grid_width == 0 else thin_lines).append(f"M{offset},0V{size}")
+        (thick_lines if k % sub_grid_height == 0 else thin_lines).append(f"M0,{offset}H{size}")
+    
+    clue_cells = []
+    texts = []
     for i, row in enumerate(board):
-        html += "<tr>"
+        y = i * SVG_CELL_SIZE
         for j, cell in enumerate(row):
-            classes = []
+            if cell:
+                x = j * SVG_CELL_SIZE
+                clue_cells.append(f"M{x},{y}h{SVG_CELL_SIZE}v{SVG_CELL_SIZE}h-{SVG_CELL_SIZE}z")
+                texts.append(f'<text x="{x + SVG_CELL_SIZE // 2}" y="{y + SVG_CELL_SIZE // 2}">{cell}</text>')
+    
+    # Pad the view box so the outer border is not clipped
+    return (
+        f'<svg class="sudoku-svg" width="{size + 2}" height="{size + 2}" viewBox="-1 -1 {size + 2} {size + 2}">'
+        + f'<path class="clue-cells" d="{"".join(clue_cells)}"/>'
+        + f'<path class="grid-thin" d="{"".join(thin_lines)}"/>'
+        + f'<path class="grid-thick" d="{"".join(thick_lines)}"/>'
+        + "".join(texts)
+        + "</svg>"
+    )
+
+
+# Solutions are also kept on disk, so puzzles solved before a restart are still lookups
+SOLUTION_CACHE_PATH = ".sudoku_solve_cache"
+
+# Once this many puzzles are stored the file is started over, which keeps it bounded on a long-running server
+SOLUTION_CACHE_MAX_ENTRIES = 256
+
+
+@st.cache_resource(show_spinner=False)
+def get_solution_cache_lock():
+    """Lock shared by all sessions, as the shelve file does not support concurrent access"""
+    return threading.Lock()
+
+
+def solution_cache_key(puzzle_string, sub_grid_width, sub_grid_height, max_solutions):
+    return f"{sub_grid_width}x{sub_grid_height}:{max_solutions}:{puzzle_string}"
+
+
+def load_cached_solutions(cache_key):
+    """Return the solutions stored on disk for a cache key, or None if there are none"""
+    try:
+        with get_solution_cache_lock(), shelve.open(SOLUTION_CACHE_PATH) as cache:
+            try:
+                return cache.get(cache_key)
+            except Exception:
+                # A corrupt entry is dropped, so the next solve stores a good one in its place
+                del cache[cache_key]
+                return None
+    except dbm.error:
+        # An unusable cache only costs a solve
+        return None
+
+
+def store_cached_solutions(cache_key, solutions):
+    try:
+        with get_solution_cache_lock():
+            with shelve.open(SOLUTION_CACHE_PATH) as cache:
+                if cache_key in cache or len(cache) < SOLUTION_CACHE_MAX_ENTRIES:
+                    cache[cache_key] = solutions
+                    return
             
-            # Add thick borders for sub-grid boundaries
-            if (j + 1) % sub_grid_width == 0 and j < grid_size - 1:
-                classes.append("thick-right")
-            if (i + 1) % sub_grid_height == 0 and i < grid_size - 1:
-                classes.append("thick-bottom")
+            # Start over rather than deleting entries, as dbm.dumb never reclaims the space of deleted ones
+            with shelve.open(SOLUTION_CACHE_PATH, flag="n") as cache:
+                cache[cache_key] = solutions
+    except dbm.error:
+        pass
+
+
+def clear_solution_cache():
+    """Clear both the in-memory and the on-disk solution caches"""
+    solve_cached.clear()
+    try:
+        with get_solution_cache_lock(), shelve.open(SOLUTION_CACHE_PATH, flag="n"):
+            pass
+    except dbm.error:
+        pass
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def solve_cached(puzzle_string, sub_grid_width, sub_grid_height, show_output=False):
+    """Solve a puzzle given as a string, caching the solution across reruns and restarts"""
+    cache_key = solution_cache_key(puzzle_string, sub_grid_width, sub_grid_height, 1)
+    solutions = load_cached_solutions(cache_key)
+    
+    if solutions is None:
+        solver = get_solver_class().from_string(
+            puzzle_string,
+            sub_grid_width=sub_grid_width,
+            sub_grid_height=sub_grid_height
+        )
+        solutions = [solver.get_solution()] if solver.solve(show_output=show_output) else []
+        store_cached_solutions(cache_key, solutions)
+    
+    return solutions[0] if solutions else None
+
+
+# Multiple-solution searches on puzzles with at least this many empty cells are split across processes
+PARALLEL_SEARCH_MIN_EMPTY_CELLS = 40
+
+# Grids up to this size enumerate solutions with the bitmask backtracking search instead of MIP
+FAST_SEARCH_MAX_GRID_SIZE = 9
+
+
+def cell_candidates(board, row, col, sub_grid_width, sub_grid_height):
+    """Values that can be placed in a cell without clashing with its row, column or sub-grid"""
+    box_row = row - row % sub_grid_height
+    box_col = col - col % sub_grid_width
+    
+    used = set(board[row])
+    used.update(board[r][col] for r in range(len(board)))
+    used.update(
+        board[r][c]
+        for r in range(box_row, box_row + sub_grid_height)
+        for c in range(box_col, box_col + sub_grid_width)
+    )
+    
+    return [value for value in range(1, len(board) + 1) if value not in used]
+
+
+def iter_solutions(puzzle_string, sub_grid_width, sub_grid_height, max_solutions, known_solution=None):
+    """Yield up to max_solutions solutions one at a time as the solver finds them"""
+    solver = get_solver_class().from_string(
+        puzzle_string,
+        sub_grid_width=sub_grid_width,
+        sub_grid_height=sub_grid_height
+    )
+    
+    # Small grids are enumerated far quicker by backtracking than by repeated MIP solves
+    if sub_grid_width * sub_grid_height <= FAST_SEARCH_MAX_GRID_SIZE:
+        yield from sudoku_fast.iter_solutions(solver.board, sub_grid_width, sub_grid_height, max_solutions)
+        return
+    
+    # Puzzles with many empty cells tend to have many solutions, so search the branches in parallel
+    empty_cells = [(r, c) for r, row in enumerate(solver.board) for c, cell in enumerate(row) if cell is None]
+    if len(empty_cells) >= PARALLEL_SEARCH_MIN_EMPTY_CELLS and (os.cpu_count() or 1) > 1:
+        row, col = empty_cells[0]
+        candidates = cell_candidates(solver.board, row, col, sub_grid_width, sub_grid_height)
+        if len(candidates) > 1:
+            yield from iter_solutions_parallel(solver, row, col, candidates, max_solutions)
+            return
+    
+    # A solution from an earlier single solve is cut off straight away, saving the first MIP solve
+    found = 0
+    if known_solution is not None:
+        solver.build_model()
+        solver.current_solution = [row[:] for row in known_solution]
+        yield [row[:] for row in known_solution]
+        solver.cut_current_solution()
+        found = 1
+    
+    # Same search as find_all_solutions, but hands each solution over as soon as it is found
+    for _ in range(max_solutions - found):
+        if not solver.solve():
+            return
+        yield [row[:] for row in solver.current_solution]
+        solver.cut_current_solution()
+
+
+def get_worker_item(item_queue, processes, worker_name):
+    """Wait for the next item from worker processes, raising if they all exited without sending one"""
+    while True:
+        try:
+            return item_queue.get(timeout=1)
+        except queue.Empty:
+            if any(process.is_alive() for process in processes):
+                continue
             
-            if cell == 0 or cell is None:
-                classes.append("empty")
-                display_value = "·"
-            else:
-                classes.append("clue")
-                display_value = str(cell)
+            # A worker can send its last items just before exiting, so those are still read
+            try:
+                return item_queue.get_nowait()
+            except queue.Empty:
+                # A worker that died without signing off would otherwise hold up the caller forever
+                raise RuntimeError(f"{worker_name} exited unexpectedly")
+
+
+def iter_solutions_parallel(solver, row, col, candidates, max_solutions):
+    """Fix one cell to each of its candidate values and search the resulting branches in separate processes"""
+    # Branches claim solutions from one shared budget and stream each one as soon as it is found
+    budget = WORKER_CONTEXT.Value("i", max_solutions)
+    solution_queue = WORKER_CONTEXT.Queue()
+    
+    branch_boards = []
+    for value in candidates:
+        branch_board = [board_row[:] for board_row in solver.board]
+        branch_board[row][col] = value
+        branch_boards.append(branch_board)
+    
+    processes = []
+    
+    def start_branch():
+        process = WORKER_CONTEXT.Process(
+            target=sudoku_parallel.stream_branch_solutions,
+            args=(type(solver), branch_boards.pop(), solver.sub_grid_width, solver.sub_grid_height, budget, solution_queue),
+            daemon=True
+        )
+        process.start()
+        processes.append(process)
+    
+    try:
+        # One branch per core, with the next branch started whenever one runs out of solutions
+        for _ in range(min(len(branch_boards), os.cpu_count() or 1)):
+            start_branch()
+        running = len(processes)
+        
+        found = 0
+        while running:
+            item = get_worker_item(solution_queue, processes, "branch worker")
+            if item is None:
+                running -= 1
+                if branch_boards and budget.value > 0:
+                    start_branch()
+                    running += 1
+                continue
+            if isinstance(item, Exception):
+                raise item
             
-            class_attr = f' class="{" ".join(classes)}"' if classes else ""
-            html += f"<td{class_attr}>{display_value}</td>"
-        html += "</tr>"
+            yield item
+            found += 1
+            if found == max_solutions:
+                return
+    finally:
+        # Also runs when the search is stopped early, so no branch keeps solving in the background
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+
+def find_clue_conflict(board, sub_grid_width, sub_grid_height):
+    """Return (row, col, value) of the first clue repeating a value in its row, column or sub-grid"""
+    grid_size = len(board)
+    boxes_per_row = grid_size // sub_grid_width
     
-    html += "</table>"
-    return html
+    # Values placed so far per row, column and sub-grid, so each clue only checks the three units it affects
+    rows = [set() for _ in range(grid_size)]
+    cols = [set() for _ in range(grid_size)]
+    boxes = [set() for _ in range(grid_size)]
+    
+    for r, row in enumerate(board_to_array(board).tolist()):
+        for c, value in enumerate(row):
+            if not value:
+                continue
+            box = (r // sub_grid_height) * boxes_per_row + c // sub_grid_width
+            if value in rows[r] or value in cols[c] or value in boxes[box]:
+                return r, c, value
+            rows[r].add(value)
+            cols[c].add(value)
+            boxes[box].add(value)
+    
+    return None
 
 
 def solve_puzzle_with_options(max_solutions, status_placeholder, show_output):
-    if 'current_solver' not in st.session_state:
+    solver = get_current_solver()
+    if solver is None:
         st.error("No active puzzle to solve!")
         return
     
-    solver = st.session_state.current_solver
+    puzzle_string = st.session_state.current_puzzle_string
+    
+    # Conflicting clues make the model infeasible, which is much cheaper to detect up front
+    conflict = find_clue_conflict(st.session_state.current_board_array, solver.sub_grid_width, solver.sub_grid_height)
+    if conflict is not None:
+        row, col, value = conflict
+        status_placeholder.error(f"Puzzle has no solution: {value} at ({row+1},{col+1}) repeats in its row, column or sub-grid")
+        return
     
     with st.spinner("Solving puzzle..." if max_solutions == 1 else f"Finding up to {max_solutions} solutions..."):
         start_time = time.time()
@@ -664,34 +1240,69 @@ def solve_puzzle_with_options(max_solutions, status_placeholder, show_output):
                 if 'multi_solve_time' in st.session_state:
                     del st.session_state.multi_solve_time
                 
-                success = solver.solve(show_output=show_output)
+                # Solutions are cached on the puzzle string, so re-solving the same puzzle is a lookup
+                solution = solve_cached(
+                    puzzle_string,
+                    solver.sub_grid_width,
+                    solver.sub_grid_height,
+                    show_output
+                )
                 solve_time = time.time() - start_time
                 
-                if success:
-                    solution = solver.get_solution()
-                    st.session_state.current_solver = solver
+                if solution is not None:
                     st.session_state.current_solution = solution
+                    st.session_state.current_solution_string = board_to_string(solution)
+                    st.session_state.current_solution_pretty = solver.get_pretty_string(solution)
                     st.session_state.solve_time = solve_time
                     
                     status_placeholder.success(f"Puzzle solved in {solve_time:.3f} seconds!")
                 else:
                     status_placeholder.error("No solution found!")
             else:
+                # Solution state is cleared whenever a new puzzle is loaded, so any single solution belongs to this puzzle
+                known_solution = st.session_state.get('current_solution')
+                
                 # Clear single solution state when solving for multiple solutions
                 if 'current_solution' in st.session_state:
                     del st.session_state.current_solution
                 if 'solve_time' in st.session_state:
                     del st.session_state.solve_time
                 
-                solutions = solver.find_all_solutions(max_solutions=max_solutions)
-                solve_time = time.time() - start_time
+                cache_key = solution_cache_key(puzzle_string, solver.sub_grid_width, solver.sub_grid_height, max_solutions)
+                solutions = load_cached_solutions(cache_key)
                 
-                # Reset the model to remove any cuts added during find_all_solutions
-                solver.reset_model()
+                if solutions is None:
+                    # Any click interrupts the script run, so the stop button only has to exist;
+                    # the solutions found so far are already in session state when the rerun starts
+                    stop_placeholder = st.empty()
+                    stop_placeholder.button("⏹️ Stop Search", key="stop_solution_search")
+                    
+                    solutions = []
+                    st.session_state.multiple_solutions = solutions
+                    # Only cleared once the search completes, so an interrupted search stays marked as stopped
+                    st.session_state.multi_search_stopped = True
+                    # Closed explicitly when the search is interrupted, so parallel branch workers stop straight away
+                    with closing(iter_solutions(
+                        puzzle_string,
+                        solver.sub_grid_width,
+                        solver.sub_grid_height,
+                        max_solutions,
+                        known_solution
+                    )) as found_solutions:
+                        for solution in found_solutions:
+                            solutions.append(solution)
+                            st.session_state.multi_solve_time = time.time() - start_time
+                            status_placeholder.info(f"Found {len(solutions)} solution(s) so far...")
+                    
+                    stop_placeholder.empty()
+                    
+                    # Only completed searches reach this point, so partial results are never cached
+                    store_cached_solutions(cache_key, solutions)
                 
-                st.session_state.current_solver = solver
+                solve_time = time.time() - start_time
                 st.session_state.multiple_solutions = solutions
                 st.session_state.multi_solve_time = solve_time
+                st.session_state.multi_search_stopped = False
                 
                 if len(solutions) == 0:
                     status_placeholder.error("No solutions found!")
@@ -703,31 +1314,56 @@ def solve_puzzle_with_options(max_solutions, status_placeholder, show_output):
                         status_placeholder.warning(f"Reached maximum limit of {max_solutions} solutions. There may be more.")
         
         except Exception as e:
+            # A failed search was not stopped, so its partial results are dropped rather than shown as interrupted
+            st.session_state.pop('multiple_solutions', None)
+            st.session_state.multi_search_stopped = False
             status_placeholder.error(f"Error solving puzzle: {str(e)}")
 
 
-def display_multiple_solutions():
+def display_multiple_solutions(solver):
     solutions = st.session_state.multiple_solutions
     
     st.subheader(f"Found {len(solutions)} Solution(s)")
     
+    if st.session_state.get('multi_search_stopped'):
+        st.warning("The search was stopped before it finished. There may be more solutions.")
+    
     if solutions:        
+        # Digest, render and label every solution once per search, so browsing them is a list lookup
+        rendered_solutions, solution_digests, solution_htmls, solution_labels = st.session_state.get(
+            'multiple_solutions_html', (None, [], [], [])
+        )
+        if rendered_solutions is not solutions or len(solution_htmls) != len(solutions):
+            solution_digests = [board_digest(solution) for solution in solutions]
+            # Kept here for the whole search, so rendering skips the shared board cache rather than flooding it
+            solution_htmls = [
+                render_sudoku_html(solution, solver.sub_grid_width, solver.sub_grid_height)
+                for solution in solutions
+            ]
+            solution_labels = [f"Solution {i + 1}" for i in range(len(solutions))]
+            st.session_state.multiple_solutions_html = (solutions, solution_digests, solution_htmls, solution_labels)
+        
         # Create a placeholder for the board that we can update
         board_placeholder = st.empty()
         
         # Solution selector (only show if there are multiple solutions)
         if len(solutions) > 1:
-            selected_solution = st.selectbox(
+            selected_label = st.selectbox(
                 "Select solution to view:",
-                range(len(solutions)),
-                format_func=lambda x: f"Solution {x+1}"
+                solution_labels
             )
+            selected_solution = solution_labels.index(selected_label)
         else:
             selected_solution = 0
         
         # Display the selected solution in the placeholder
         with board_placeholder.container():
-            display_sudoku_board(solutions[selected_solution], f"Solution {selected_solution + 1}")
+            display_sudoku_board(
+                solutions[selected_solution],
+                solver,
+                solution_labels[selected_solution],
+                board_html=solution_htmls[selected_solution]
+            )
         
         # Statistics
         st.subheader("Search Statistics")
@@ -741,8 +1377,8 @@ def display_multiple_solutions():
             avg_time = st.session_state.multi_solve_time / len(solutions)
             st.metric("Avg Time per Solution", f"{avg_time:.3f}s")
         
-        # Return the selected solution board for export
-        return solutions[selected_solution]
+        # Return the selected solution board and its digest for export
+        return solutions[selected_solution], solution_digests[selected_solution]
     
     return None
 
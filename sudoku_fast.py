@@ -0,0 +1,83 @@
+"""
+Bitmask backtracking search for small Sudoku grids.
+
+Enumerating solutions with repeated MIP solves is heavy for small grids, where a
+depth-first search over per-row, per-column and per-sub-grid bitmasks of used
+values finds them in milliseconds. Bit v-1 of a mask is set when value v is used.
+"""
+
+from itertools import islice
+
+
+def iter_solutions(board, sub_grid_width, sub_grid_height, max_solutions=None):
+    """Yield up to max_solutions solutions for a board with None or 0 for empty cells"""
+    size = sub_grid_width * sub_grid_height
+    boxes_per_row = size // sub_grid_width
+    all_values = (1 << size) - 1
+
+    rows = [0] * size
+    cols = [0] * size
+    boxes = [0] * size
+    grid = [[cell or 0 for cell in row] for row in board]
+    empty_cells = []
+
+    for r in range(size):
+        for c in range(size):
+            box = (r // sub_grid_height) * boxes_per_row + c // sub_grid_width
+            value = grid[r][c]
+            if not value:
+                empty_cells.append((r, c, box))
+                continue
+
+            bit = 1 << (value - 1)
+            if (rows[r] | cols[c] | boxes[box]) & bit:
+                return  # Conflicting clues, so there are no solutions
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[box] |= bit
+
+    def search():
+        if not empty_cells:
+            yield [row[:] for row in grid]
+            return
+
+        # Branch on the empty cell with the fewest candidates
+        best_index = None
+        best_candidates = 0
+        best_count = size + 1
+        for index, (r, c, box) in enumerate(empty_cells):
+            candidates = all_values & ~(rows[r] | cols[c] | boxes[box])
+            count = bin(candidates).count("1")
+            if count < best_count:
+                best_index, best_candidates, best_count = index, candidates, count
+                if count <= 1:
+                    break
+
+        if best_count == 0:
+            return
+
+        r, c, box = empty_cells[best_index]
+        empty_cells[best_index] = empty_cells[-1]
+        empty_cells.pop()
+
+        candidates = best_candidates
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+
+            grid[r][c] = bit.bit_length()
+            rows[r] |= bit
+            cols[c] |= bit
+            boxes[box] |= bit
+
+            yield from search()
+
+            rows[r] ^= bit
+            cols[c] ^= bit
+            boxes[box] ^= bit
+
+        grid[r][c] = 0
+        empty_cells.append((r, c, box))
+        empty_cells[best_index], empty_cells[-1] = empty_cells[-1], empty_cells[best_index]
+
+    yield from islice(search(), max_solutions)
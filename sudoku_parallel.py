@@ -0,0 +1,38 @@
+"""
+Workers for puzzle generation and multiple-solution searches split across processes.
+
+The dashboard races independent generators, and searches the branches it gets by
+fixing one empty cell to each of its candidate values, in spawned processes.
+Spawned processes can only run functions they can import, so the workers live in
+this module rather than in the Streamlit script.
+"""
+
+
+def generate_puzzle_to_queue(solver_class, generation_args, result_queue):
+    """Put a generated (solver, difficulty) pair, or the error raised, on result_queue"""
+    try:
+        result_queue.put(solver_class.generate_random_puzzle(**generation_args))
+    except Exception as e:
+        result_queue.put(e)
+
+
+def stream_branch_solutions(solver_class, board, sub_grid_width, sub_grid_height, budget, solution_queue):
+    """Put a branch's solutions on solution_queue while the shared budget lasts, then None"""
+    try:
+        solver = solver_class(board, sub_grid_width, sub_grid_height)
+        solver.build_model()
+
+        while budget.value > 0 and solver.solve():
+            # Claim a slot before handing the solution over, so the branches never exceed the budget together
+            with budget.get_lock():
+                if budget.value <= 0:
+                    return
+                budget.value -= 1
+
+            solution_queue.put([row[:] for row in solver.current_solution])
+            solver.cut_current_solution()
+    except Exception as e:
+        solution_queue.put(e)
+    finally:
+        # Tells the search this branch is done, whether it ran out of solutions or budget
+        solution_queue.put(None)